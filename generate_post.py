@@ -6,6 +6,7 @@ and rebuild both the homepage (index.html) and the full daily-brief archive
 
 Usage:
     python generate_post.py path/to/tucson-brief-2026-02-18.md
+    python generate_post.py briefings/tucson-brief-2026-02-*.md   # batch: one homepage rebuild
     python generate_post.py --rebuild-homepage     # refresh only (no new post)
 """
 
@@ -14,7 +15,9 @@ import os
 import re
 import json
 import argparse
+import bisect
 from datetime import datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
 
 SITE_DIR = Path(__file__).resolve().parent
@@ -58,21 +61,37 @@ SOURCE_URLS = {
 # Date and slug helpers
 # ---------------------------------------------------------------------------
 
+# The ISO date embedded in every dated filename (briefs, meetings, reports…).
+DATE_RE = re.compile(r"(\d{4}-\d{2}-\d{2})")
+
+
+def _parse_iso(s: str) -> datetime:
+    """datetime for a YYYY-MM-DD string (as captured by DATE_RE). Slices the
+    fixed-width fields directly instead of going through strptime's
+    format-parsing machinery; an impossible date still raises ValueError."""
+    return datetime(int(s[0:4]), int(s[5:7]), int(s[8:10]))
+
+
 def parse_date_from_filename(filepath: str) -> datetime:
     """Extract date from a filename like tucson-brief-2026-02-18.md."""
     basename = Path(filepath).stem
-    match = re.search(r"(\d{4}-\d{2}-\d{2})", basename)
+    match = DATE_RE.search(basename)
     if not match:
         print(f"Error: could not extract date from filename '{basename}'", file=sys.stderr)
         sys.exit(1)
-    return datetime.strptime(match.group(1), "%Y-%m-%d")
+    return _parse_iso(match.group(1))
 
 
+# The formatters below run several times per post on every rebuild (archive
+# list, prev/next nav, RSS, post pages) over a small set of distinct dates, so
+# they're memoized rather than re-running strftime each time.
+@lru_cache(maxsize=4096)
 def format_date_long(dt: datetime) -> str:
     """February 18, 2026"""
     return dt.strftime("%B %-d, %Y")
 
 
+@lru_cache(maxsize=4096)
 def format_date_short(dt: datetime) -> str:
     """Feb 18, 2026"""
     return dt.strftime("%b %-d, %Y")
@@ -83,6 +102,7 @@ def format_date_eyebrow(dt: datetime) -> str:
     return dt.strftime("%A, %B %-d").upper()
 
 
+@lru_cache(maxsize=4096)
 def post_slug(dt: datetime) -> str:
     """2026-02-18"""
     return dt.strftime("%Y-%m-%d")
@@ -92,20 +112,39 @@ def post_slug(dt: datetime) -> str:
 # HTML helpers
 # ---------------------------------------------------------------------------
 
+# Compiled once at import — the lede/headline scans run once per post.
+BOLD_RE = re.compile(r"\*\*(.+?)\*\*")
+LEDE_P_RE = re.compile(r'<p class="post-lede"[^>]*>(.+?)</p>')
+STRONG_RE = re.compile(r"<strong>(.+?)</strong>")
+
+_ESCAPE_TABLE = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;"})
+
+
 def escape(text: str) -> str:
-    """Escape HTML special characters."""
-    return (text
-            .replace("&", "&amp;")
-            .replace("<", "&lt;")
-            .replace(">", "&gt;")
-            .replace('"', "&quot;"))
+    """Escape HTML special characters (one translate pass, not four replaces)."""
+    return text.translate(_ESCAPE_TABLE)
 
 
 def inline_format(text: str) -> str:
-    """Handle bold (**text**) within already-safe-ish content."""
-    text = escape(text)
-    text = re.sub(r"\*\*(.+?)\*\*", r"<strong>\1</strong>", text)
-    return text
+    """Escape text and convert **bold** to <strong>, in one walk of the string:
+    the runs between bold spans and the bold spans themselves are escaped as
+    they're emitted."""
+    out = []
+    _inline_format_into(out, text)
+    return "".join(out)
+
+
+def _inline_format_into(out: list[str], text: str) -> None:
+    """inline_format(), appending its fragments to `out` instead of returning a
+    joined string — lets md_to_html stream a paragraph straight into its page."""
+    last = 0
+    for m in BOLD_RE.finditer(text):
+        out.append(escape(text[last:m.start()]))
+        out.append("<strong>")
+        out.append(escape(m.group(1)))
+        out.append("</strong>")
+        last = m.end()
+    out.append(escape(text[last:]))
 
 
 # ---------------------------------------------------------------------------
@@ -168,9 +207,50 @@ def topic_badge_html(keys: list[str]) -> str:
 # Briefing markdown → HTML
 # ---------------------------------------------------------------------------
 
+# md_to_html() classifies every line of a briefing, so these two tests are
+# plain character checks rather than regex matches.
+def _is_hr(s: str) -> bool:
+    """A separator line: three or more of ─ / - and nothing else."""
+    return len(s) >= 3 and not s.strip("─-")
+
+
+def _is_emoji_head(s: str) -> bool:
+    """True when the line opens with an emoji/pictograph (U+1F300–U+1FAFF,
+    U+2600–U+27BF, or a stray VS16) — the section-header marker."""
+    if not s:
+        return False
+    o = ord(s[0])
+    if o < 0x2600:          # every ASCII/Latin line: one compare and out
+        return False
+    return (0x1F300 <= o <= 0x1FAFF) or o <= 0x27BF or o == 0xFE0F
+
+
+# Line kinds for md_to_html(). A CALLOUT is an emoji-prefixed line carrying
+# **bold** (e.g. "⚠️ **Extreme Heat Watch…**"): it opens a paragraph like TEXT,
+# but — like every emoji-prefixed line — it never continues one.
+_EMPTY, _HR, _SOURCE, _HEADER, _CALLOUT, _TEXT = range(6)
+
+
+def _classify_line(s: str) -> int:
+    """Kind of one stripped briefing line."""
+    if not s:
+        return _EMPTY
+    if _is_hr(s):
+        return _HR
+    if s.startswith("\U0001f4f0") or s.startswith("\U0001f4c4"):
+        return _SOURCE
+    if _is_emoji_head(s):
+        return _CALLOUT if "**" in s else _HEADER
+    return _TEXT
+
+
 def md_to_html(text: str) -> str:
     """Convert briefing markdown to HTML."""
     lines = text.strip().split("\n")
+    # Strip once up front; everything below works on the stripped lines.
+    stripped = [line.strip() for line in lines]
+    # Output fragments, joined once at the end. Each block ends in "\n"; the
+    # final one is trimmed so blocks come out newline-separated.
     html_parts = []
     i = 0
 
@@ -187,65 +267,64 @@ def md_to_html(text: str) -> str:
     # to the end (it's metadata for the Telegram message, not for publication).
     # Any blank line or separator immediately preceding it is dropped too, so no
     # dangling <hr> is left behind.
-    end = len(lines)
-    for j in range(len(lines) - 1, -1, -1):
+    end = len(stripped)
+    for j in range(len(stripped) - 1, -1, -1):
         # tolerate bold-wrapped markers like "**Briefing saved:**"
-        if lines[j].strip().lstrip("*").startswith("Briefing saved:"):
+        if stripped[j].lstrip("*").startswith("Briefing saved:"):
             end = j
             break
-    while end > 0:
-        prev = lines[end - 1].strip()
-        if (not prev) or re.match(r"^[─\-]{3,}$", prev):
-            end -= 1
-        else:
-            break
+
+    # Every line up to the marker is classified exactly once; the trailing
+    # blank/separator trim, the dispatch below, and the paragraph continuation
+    # scan all read the precomputed kinds.
+    kinds = [_classify_line(s) for s in stripped[:end]]
+    while end > 0 and kinds[end - 1] in (_EMPTY, _HR):
+        end -= 1
 
     while i < end:
-        line = lines[i].strip()
+        kind = kinds[i]
 
-        if not line:
+        if kind == _EMPTY:
             i += 1
             continue
 
-        if re.match(r"^[─\-]{3,}$", line):
-            html_parts.append("<hr>")
+        if kind == _HR:
+            html_parts.append("<hr>\n")
             i += 1
             continue
 
-        if line.startswith("\U0001f4f0") or line.startswith("\U0001f4c4"):
+        line = stripped[i]
+
+        if kind == _SOURCE:
             source_text = line.replace("\U0001f4f0", "").replace("\U0001f4c4", "").strip()
-            html_parts.append(f'<p class="source">{linkify_sources(source_text)}</p>')
+            html_parts.append(f'<p class="source">{linkify_sources(source_text)}</p>\n')
             i += 1
             continue
 
         # Section headers are short, emoji-prefixed labels (e.g. "🏛️ Government").
         # An emoji-prefixed line that contains bold markdown is an inline callout
-        # (e.g. "⚠️ **Extreme Heat Watch…**"), NOT a section header — let it fall
-        # through to the paragraph branch so the **bold** is converted properly.
-        if (re.match(r"^[\U0001f300-\U0001faff☀-➿️]", line)
-                and "**" not in line):
-            html_parts.append(f"<h2>{escape(line)}</h2>")
+        # (e.g. "⚠️ **Extreme Heat Watch…**"), NOT a section header — it's
+        # classified _CALLOUT and falls through to the paragraph branch so the
+        # **bold** is converted properly.
+        if kind == _HEADER:
+            html_parts.append(f"<h2>{escape(line)}</h2>\n")
             i += 1
             continue
 
-        para_lines = [line]
-        i += 1
-        while i < end:
-            next_line = lines[i].strip()
-            if (not next_line or
-                    next_line.startswith("\U0001f4f0") or
-                    next_line.startswith("\U0001f4c4") or
-                    re.match(r"^[─\-]{3,}$", next_line) or
-                    re.match(r"^[\U0001f300-\U0001faff☀-➿️]", next_line)):
-                break
-            para_lines.append(next_line)
-            i += 1
-
-        para_text = " ".join(para_lines)
-        para_html = inline_format(para_text)
-        html_parts.append(f"<p>{para_html}</p>")
+        # A paragraph runs on through following plain-text lines. Its formatted
+        # fragments go straight into html_parts. A multi-line paragraph is still
+        # joined first, because a **bold** run may span a line break.
+        j = i + 1
+        while j < end and kinds[j] == _TEXT:
+            j += 1
+        html_parts.append("<p>")
+        _inline_format_into(html_parts, line if j == i + 1 else " ".join(stripped[i:j]))
+        html_parts.append("</p>\n")
+        i = j
 
-    return "\n".join(html_parts)
+    if html_parts:
+        html_parts[-1] = html_parts[-1][:-1]
+    return "".join(html_parts)
 
 
 def linkify_sources(text: str) -> str:
@@ -267,18 +346,22 @@ def linkify_sources(text: str) -> str:
     return result
 
 
+LEDE_SCAN_CHARS = 2048
+
+
 def extract_lede(text: str) -> str:
-    """Pull the first story headline for the index listing."""
-    for line in text.strip().split("\n"):
-        match = re.search(r"\*\*(.+?)\*\*", line)
-        if match:
-            headline = match.group(1)
-            if headline.endswith("."):
-                headline = headline[:-1]
-            if len(headline) > 120:
-                headline = headline[:117] + "..."
-            return headline
-    return ""
+    """Pull the first story headline for the index listing. Only the first
+    LEDE_SCAN_CHARS characters are searched; returns "" if no **bold** run
+    starts and ends within them."""
+    match = BOLD_RE.search(text, 0, LEDE_SCAN_CHARS)
+    if not match:
+        return ""
+    headline = match.group(1)
+    if headline.endswith("."):
+        headline = headline[:-1]
+    if len(headline) > 120:
+        headline = headline[:117] + "..."
+    return headline
 
 
 # ---------------------------------------------------------------------------
@@ -386,13 +469,16 @@ def derive_description(body_html: str, max_len: int = 160) -> str:
 def extract_headline(md_text: str) -> str:
     """First real story headline from a briefing markdown — skips weather
     day-labels/temps (which lead the brief on weather-alert days), mirroring
-    collect_existing_posts()."""
-    for line in md_text.strip().split("\n"):
-        for match in re.finditer(r"\*\*(.+?)\*\*", line):
-            headline = match.group(1).strip()
-            if _is_weather_label(headline):
-                continue
-            return _clamp_weather_alert(headline).rstrip(".")
+    collect_existing_posts().
+
+    Scans the raw text rather than splitting it into lines: BOLD_RE can't match
+    across a newline, so the matches (and their order) are the same, and the
+    scan stops at the first real headline near the top of the brief."""
+    for match in BOLD_RE.finditer(md_text):
+        headline = match.group(1).strip()
+        if _is_weather_label(headline):
+            continue
+        return _clamp_weather_alert(headline).rstrip(".")
     return ""
 
 
@@ -642,43 +728,19 @@ def section_nav_html(active: str = "", path_prefix: str = "") -> str:
 # Post rendering (individual daily-brief page)
 # ---------------------------------------------------------------------------
 
-def render_post(date: datetime, body_html: str, headline: str = "") -> str:
-    """Render a daily-brief individual post page in the new editorial language.
-    `headline` (the day's first real story headline, plain text) feeds the
-    <title>, meta description, and NewsArticle structured data."""
-    date_long = format_date_long(date)
-    slug = post_slug(date)
-    path = f"posts/{slug}.html"
-    weekday = date.strftime("%A")
-    css_path = "../style.css"
-    home_href = "../"
-    back_href = "../briefings.html"
-
-    if headline:
-        short = headline if len(headline) <= 80 else headline[:77].rsplit(" ", 1)[0] + "..."
-        title_text = f"{short} — Tucson Daily Brief, {date_long}"
-        description = f"{headline}, plus the rest of the day's Tucson news — local government, public safety, business, and events."
-    else:
-        title_text = f"{date_long} — Tucson Daily Brief"
-        description = f"The Tucson news for {date_long} — local government, public safety, business, and events."
-    if len(description) > 300:
-        description = description[:297].rsplit(" ", 1)[0] + "…"
-    seo = seo_head_html(
-        title=title_text, description=description, path=path,
-        og_type="article", published=date,
-        jsonld=news_article_jsonld(
-            headline=headline or f"Tucson Daily Brief — {date_long}",
-            path=path, published=date, description=description),
-    )
-
-    return f"""<!DOCTYPE html>
+# The page chrome around a daily brief never varies between posts, so it's
+# rendered once at import and render_post() only fills in the per-day parts.
+# (Deliberately literal chunks + join rather than one big str.format template:
+# str.format re-parses its template on every call, and the chrome's inline
+# JS/CSS braces would all need doubling.)
+_POST_HEAD = """<!DOCTYPE html>
 <html lang="en">
 <head>
 <meta charset="utf-8">
 <meta name="viewport" content="width=device-width, initial-scale=1">
-<title>{escape(title_text)}</title>
-{seo}
-<link rel="stylesheet" href="{css_path}">
+"""
+
+_POST_CHROME = f"""<link rel="stylesheet" href="../style.css">
 {ANALYTICS_HTML}
 </head>
 <body>
@@ -686,21 +748,16 @@ def render_post(date: datetime, body_html: str, headline: str = "") -> str:
 {post_header_html()}
 
 <div class="container">
-{section_nav_html(active="briefings", path_prefix=home_href)}
+{section_nav_html(active="briefings", path_prefix="../")}
 </div>
 
 <main>
 <div class="container container--reading">
-<a class="back-link" href="{back_href}">{ARROW_LEFT_SVG} All Daily Briefs</a>
+<a class="back-link" href="../briefings.html">{ARROW_LEFT_SVG} All Daily Briefs</a>
 
-<article id="{slug}" class="brief">
-<header class="brief-header">
-<p class="brief-kicker">{SUNRAY_SVG} Daily Brief</p>
-<h1 class="brief-date">{format_date_long(date)}</h1>
-<p class="brief-weekday">{weekday}</p>
-</header>
-<div class="brief-body">
-{body_html}
+"""
+
+_POST_TAIL = f"""
 </div>
 {BLUESKY_COMMENTS_HTML}
 </article>
@@ -711,7 +768,7 @@ def render_post(date: datetime, body_html: str, headline: str = "") -> str:
 
 <div class="container">
 <div style="margin-bottom:var(--gap-xl)">{SUBSCRIBE_PANEL_HTML}</div>
-{footer_html(path_prefix=home_href)}
+{footer_html(path_prefix="../")}
 </div>
 
 {SCROLL_TRIGGER_JS}
@@ -720,6 +777,48 @@ def render_post(date: datetime, body_html: str, headline: str = "") -> str:
 """
 
 
+def render_post(date: datetime, body_html: str, headline: str = "") -> str:
+    """Render a daily-brief individual post page in the new editorial language.
+    `headline` (the day's first real story headline, plain text) feeds the
+    <title>, meta description, and NewsArticle structured data."""
+    date_long = format_date_long(date)
+    slug = post_slug(date)
+    path = f"posts/{slug}.html"
+    weekday = date.strftime("%A")
+
+    if headline:
+        short = headline if len(headline) <= 80 else headline[:77].rsplit(" ", 1)[0] + "..."
+        title_text = f"{short} — Tucson Daily Brief, {date_long}"
+        description = f"{headline}, plus the rest of the day's Tucson news — local government, public safety, business, and events."
+    else:
+        title_text = f"{date_long} — Tucson Daily Brief"
+        description = f"The Tucson news for {date_long} — local government, public safety, business, and events."
+    if len(description) > 300:
+        description = description[:297].rsplit(" ", 1)[0] + "…"
+    seo = seo_head_html(
+        title=title_text, description=description, path=path,
+        og_type="article", published=date,
+        jsonld=news_article_jsonld(
+            headline=headline or f"Tucson Daily Brief — {date_long}",
+            path=path, published=date, description=description),
+    )
+
+    parts = [_POST_HEAD]
+    parts.append(f"<title>{escape(title_text)}</title>\n{seo}\n")
+    parts.append(_POST_CHROME)
+    parts.append(f"""<article id="{slug}" class="brief">
+<header class="brief-header">
+<p class="brief-kicker">{SUNRAY_SVG} Daily Brief</p>
+<h1 class="brief-date">{date_long}</h1>
+<p class="brief-weekday">{weekday}</p>
+</header>
+<div class="brief-body">
+""")
+    parts.append(body_html)
+    parts.append(_POST_TAIL)
+    return "".join(parts)
+
+
 # ---------------------------------------------------------------------------
 # Prev/next edition navigation (habit loop between daily briefs)
 # ---------------------------------------------------------------------------
@@ -814,35 +913,171 @@ def _clamp_weather_alert(s: str) -> str:
     return _first_sentence(s) if _ALERT_BLOCK_RE.match(s) else s
 
 
+# Per-file lede cache for collect_existing_posts(), keyed by filename and
+# validated against (mtime_ns, size), so a rebuild only re-reads the briefs that
+# actually changed since the last run.
+POST_CACHE_FILE = POSTS_DIR / ".index_cache.json"
+# Bump whenever lede extraction changes (_post_lede, _is_weather_label,
+# _clamp_weather_alert) so every cached lede is recomputed on the next rebuild.
+_LEDE_CACHE_VERSION = 1
+
+
+def _load_post_cache() -> dict:
+    """The cached entries, or {} if the cache is missing, unreadable, malformed,
+    or was written by a different _LEDE_CACHE_VERSION."""
+    if POST_CACHE_FILE.exists():
+        try:
+            cache = json.loads(POST_CACHE_FILE.read_text())
+        except json.JSONDecodeError:
+            return {}
+        if isinstance(cache, dict) and cache.get("version") == _LEDE_CACHE_VERSION:
+            entries = cache.get("posts")
+            return entries if isinstance(entries, dict) else {}
+    return {}
+
+
+def _save_post_cache(entries: dict) -> None:
+    """Write the cached entries back to POST_CACHE_FILE, stamped with the version."""
+    POST_CACHE_FILE.write_text(json.dumps(
+        {"version": _LEDE_CACHE_VERSION, "posts": entries}, indent=2, sort_keys=True))
+
+
+def _post_lede(content: str) -> str:
+    """The index-listing lede for a rendered daily-brief page."""
+    lede_match = LEDE_P_RE.search(content)
+    if lede_match:
+        return lede_match.group(1)
+    # First real headline — skip weather day-labels/temps, which lead the
+    # brief on days with an active weather alert.
+    for sm in STRONG_RE.finditer(content):
+        cand = sm.group(1).strip()
+        if _is_weather_label(cand):
+            continue
+        return _clamp_weather_alert(cand).rstrip(".")
+    return ""
+
+
+# A rendered brief's first headline sits just past the page chrome (~5.5 KB
+# in), so reading this much of the file almost always settles the lede.
+POST_LEDE_PREFIX = 8192
+
+
+def _read_post_lede(path: str) -> str:
+    """_post_lede() for a file on disk, reading only its first POST_LEDE_PREFIX
+    bytes; falls back to the whole file when the prefix holds no lede."""
+    with open(path, "rb") as fh:
+        head = fh.read(POST_LEDE_PREFIX)
+        lede = _post_lede(head.decode("utf-8", "ignore"))
+        if lede or len(head) < POST_LEDE_PREFIX:
+            return lede
+        rest = fh.read()
+    return _post_lede((head + rest).decode("utf-8"))
+
+
 def collect_existing_posts() -> list[dict]:
-    """Scan posts/ directory for existing HTML files and extract metadata."""
+    """Scan posts/ directory for existing HTML files and extract metadata.
+    Ledes come from POST_CACHE_FILE when a file's mtime and size are unchanged."""
     posts = []
     if not POSTS_DIR.exists():
         return posts
-    for f in POSTS_DIR.glob("*.html"):
-        match = re.search(r"(\d{4}-\d{2}-\d{2})", f.stem)
-        if not match:
-            continue
-        dt = datetime.strptime(match.group(1), "%Y-%m-%d")
-        content = f.read_text()
-        lede_match = re.search(r'<p class="post-lede"[^>]*>(.+?)</p>', content)
-        if lede_match:
-            lede = lede_match.group(1)
-        else:
-            # First real headline — skip weather day-labels/temps, which lead the
-            # brief on days with an active weather alert.
-            lede = ""
-            for sm in re.finditer(r"<strong>(.+?)</strong>", content):
-                cand = sm.group(1).strip()
-                if _is_weather_label(cand):
-                    continue
-                lede = _clamp_weather_alert(cand).rstrip(".")
-                break
-        posts.append({"date": dt, "slug": post_slug(dt), "lede": lede})
+    cache = _load_post_cache()
+    fresh = {}
+    # os.scandir, not Path.glob: no fnmatch pass or Path object per entry, and
+    # the DirEntry carries the file type, so only real files get stat()ed.
+    with os.scandir(POSTS_DIR) as it:
+        for entry in it:
+            name = entry.name
+            if not name.endswith(".html") or not entry.is_file(follow_symlinks=False):
+                continue
+            match = DATE_RE.search(name[:-5])
+            if not match:
+                continue
+            dt = _parse_iso(match.group(1))
+            st = entry.stat(follow_symlinks=False)
+            hit = cache.get(name)
+            if (isinstance(hit, dict) and "lede" in hit
+                    and hit.get("mtime") == st.st_mtime_ns and hit.get("size") == st.st_size):
+                lede = hit["lede"]
+            else:
+                lede = _read_post_lede(entry.path)
+            fresh[name] = {"mtime": st.st_mtime_ns, "size": st.st_size, "lede": lede}
+            posts.append({"date": dt, "slug": post_slug(dt), "lede": lede})
+    if fresh != cache:
+        _save_post_cache(fresh)
     posts.sort(key=lambda p: p["date"], reverse=True)
     return posts
 
 
+# The daily-brief listing (date, slug, lede per post, newest first), persisted
+# so a publish reads one JSON file instead of re-deriving every lede.
+# generate_many() splices new posts in; load_posts() falls back to
+# collect_existing_posts() when the file is missing, unreadable, or out of step
+# with posts/, and a bare rebuild_homepage() always rescans and rewrites it.
+INDEX_STATE = SITE_DIR / "posts.json"
+
+
+def _load_index_state() -> list[dict] | None:
+    """The persisted listing, or None if it's missing or unreadable."""
+    if not INDEX_STATE.exists():
+        return None
+    try:
+        state = json.loads(INDEX_STATE.read_text())
+        return [{"date": _parse_iso(p["date"]), "slug": p["slug"], "lede": p["lede"]}
+                for p in state]
+    except (json.JSONDecodeError, KeyError, TypeError, ValueError):
+        return None
+
+
+def _save_index_state(posts: list[dict]) -> None:
+    """Write the newest-first listing to INDEX_STATE."""
+    state = [{"date": post_slug(p["date"]), "slug": p["slug"], "lede": p["lede"]}
+             for p in posts]
+    INDEX_STATE.write_text(json.dumps(state, indent=2, ensure_ascii=False))
+
+
+def _newest_first(post: dict) -> int:
+    """Ascending sort key for a newest-first post list (bisect needs ascending)."""
+    return -post["date"].toordinal()
+
+
+def _splice_post(posts: list[dict], entry: dict) -> None:
+    """Upsert `entry` into the newest-first `posts` in place. The list holds one
+    post per date, so a bisect finds the slot: a re-run day is overwritten where
+    it sits, a new day is inserted — no re-sort."""
+    pos = bisect.bisect_left(posts, _newest_first(entry), key=_newest_first)
+    if pos < len(posts) and posts[pos]["slug"] == entry["slug"]:
+        posts[pos] = entry
+    else:
+        posts.insert(pos, entry)
+
+
+def _post_slugs_on_disk() -> set[str]:
+    """Slugs of the dated .html files in posts/, from one directory listing."""
+    slugs = set()
+    if not POSTS_DIR.exists():
+        return slugs
+    with os.scandir(POSTS_DIR) as it:
+        for entry in it:
+            name = entry.name
+            if name.endswith(".html") and entry.is_file(follow_symlinks=False):
+                match = DATE_RE.search(name[:-5])
+                if match:
+                    slugs.add(match.group(1))
+    return slugs
+
+
+def load_posts() -> list[dict]:
+    """The newest-first post list from INDEX_STATE, falling back to (and
+    re-seeding the state from) a posts/ scan when the state is missing or its
+    slugs no longer match the files in posts/ — e.g. after a git pull of posts
+    published elsewhere, or a deleted post."""
+    posts = _load_index_state()
+    if posts is None or {p["slug"] for p in posts} != _post_slugs_on_disk():
+        posts = collect_existing_posts()
+        _save_index_state(posts)
+    return posts
+
+
 def collect_brief_rundown(slug: str, n: int = 4) -> list[str]:
     """The top N story headlines from a brief's HTML, for the homepage
     'This morning in Tucson' rundown. Skips weather day-labels the same way
@@ -853,7 +1088,7 @@ def collect_brief_rundown(slug: str, n: int = 4) -> list[str]:
         return []
     content = path.read_text()
     items = []
-    for sm in re.finditer(r"<strong>(.+?)</strong>", content):
+    for sm in STRONG_RE.finditer(content):
         cand = _unescape_and_truncate(sm.group(1), max_len=0).strip()
         if not cand or _is_weather_label(cand):
             continue
@@ -869,10 +1104,10 @@ def _newest_html_in(directory: Path) -> Path | None:
         return None
     candidates = []
     for f in directory.glob("*.html"):
-        m = re.search(r"(\d{4}-\d{2}-\d{2})", f.stem)
+        m = DATE_RE.search(f.stem)
         if not m:
             continue
-        dt = datetime.strptime(m.group(1), "%Y-%m-%d")
+        dt = _parse_iso(m.group(1))
         candidates.append((dt, f))
     if not candidates:
         return None
@@ -909,8 +1144,8 @@ def collect_latest_meeting() -> dict | None:
     f = _newest_html_in(MEETINGS_DIR)
     if not f:
         return None
-    m = re.search(r"(\d{4}-\d{2}-\d{2})", f.stem)
-    dt = datetime.strptime(m.group(1), "%Y-%m-%d")
+    m = DATE_RE.search(f.stem)
+    dt = _parse_iso(m.group(1))
     content = f.read_text()
     title = _article_h1(content) or f.stem
     # Lede: paragraph right after the "Meeting Preview" h2 (editorial overview)
@@ -933,8 +1168,8 @@ def collect_latest_report() -> dict | None:
     f = _newest_html_in(REPORTS_DIR)
     if not f:
         return None
-    m = re.search(r"(\d{4}-\d{2}-\d{2})", f.stem)
-    dt = datetime.strptime(m.group(1), "%Y-%m-%d")
+    m = DATE_RE.search(f.stem)
+    dt = _parse_iso(m.group(1))
     content = f.read_text()
     title = _article_h1(content) or f.stem
     # Lede: first <p><strong>...</strong></p> after the h1 (the bold lede paragraph)
@@ -961,10 +1196,10 @@ def _collect_at_dir(directory: Path, href_prefix: str, kind: str, kind_label: st
         return items
     pattern = "liquor-*.html" if kind == "new-business" else "*.html"
     for f in directory.glob(pattern):
-        m = re.search(r"(\d{4}-\d{2}-\d{2})", f.stem)
+        m = DATE_RE.search(f.stem)
         if not m:
             continue
-        dt = datetime.strptime(m.group(1), "%Y-%m-%d")
+        dt = _parse_iso(m.group(1))
         content = f.read_text()
         title = _article_h1(content) or f.stem
         lede = ""
@@ -1010,7 +1245,7 @@ def collect_latest_indepth() -> dict | None:
         m = re.search(r'<meta name="published" content="(\d{4}-\d{2}-\d{2})">', content)
         if not m:
             continue
-        candidates.append((datetime.strptime(m.group(1), "%Y-%m-%d"), f, content))
+        candidates.append((_parse_iso(m.group(1)), f, content))
     if not candidates:
         return None
     candidates.sort(key=lambda x: x[0], reverse=True)
@@ -1139,10 +1374,10 @@ def collect_next_meeting() -> dict | None:
     today = datetime.now().date()
     cands = []
     for f in MEETINGS_DIR.glob("*.html"):
-        m = re.search(r"(\d{4}-\d{2}-\d{2})", f.stem)
+        m = DATE_RE.search(f.stem)
         if not m:
             continue
-        dt = datetime.strptime(m.group(1), "%Y-%m-%d")
+        dt = _parse_iso(m.group(1))
         if dt.date() >= today:
             cands.append((dt, f))
     cands.sort()
@@ -1224,10 +1459,10 @@ def collect_week_items(start, end) -> list[dict]:
         if not directory.exists():
             return
         for f in directory.glob("*.html"):
-            m = re.search(r"(\d{4}-\d{2}-\d{2})", f.stem)
+            m = DATE_RE.search(f.stem)
             if not m:
                 continue
-            dt = datetime.strptime(m.group(1), "%Y-%m-%d")
+            dt = _parse_iso(m.group(1))
             if not (start <= dt.date() <= end):
                 continue
             title = _article_h1(f.read_text()) or f.stem
@@ -1499,19 +1734,7 @@ def render_homepage(posts: list[dict],
 """
 
 
-def render_briefings_index(posts: list[dict]) -> str:
-    """Render the full daily-brief archive page."""
-    items = []
-    for p in posts:
-        items.append(f"""<li>
-<span class="post-date">{format_date_short(p["date"])}</span>
-<a href="posts/{p["slug"]}.html">{format_date_long(p["date"])}</a>
-<p class="post-lede">{escape(p["lede"])}</p>
-</li>""")
-
-    post_list = "\n".join(items) if items else '<li class="empty">No briefings yet.</li>'
-
-    return f"""<!DOCTYPE html>
+_BRIEFINGS_INDEX_HEAD = f"""<!DOCTYPE html>
 <html lang="en">
 <head>
 <meta charset="utf-8">
@@ -1542,8 +1765,9 @@ def render_briefings_index(posts: list[dict]) -> str:
 <div style="margin-bottom:var(--gap-xl)">{SUBSCRIBE_PANEL_HTML}</div>
 
 <ul class="post-list">
-{post_list}
-</ul>
+"""
+
+_BRIEFINGS_INDEX_TAIL = f"""</ul>
 </div>
 </main>
 
@@ -1557,6 +1781,27 @@ def render_briefings_index(posts: list[dict]) -> str:
 """
 
 
+def render_briefings_index(posts: list[dict]) -> str:
+    """Render the full daily-brief archive page. The page chrome is constant,
+    so only the post list is built per call — appended piecewise and joined
+    once."""
+    parts = [_BRIEFINGS_INDEX_HEAD]
+    for p in posts:
+        dt = p["date"]
+        date_short = format_date_short(dt)
+        date_long = format_date_long(dt)
+        parts.append(f"""<li>
+<span class="post-date">{date_short}</span>
+<a href="posts/{p["slug"]}.html">{date_long}</a>
+<p class="post-lede">{escape(p["lede"])}</p>
+</li>
+""")
+    if not posts:
+        parts.append('<li class="empty">No briefings yet.</li>\n')
+    parts.append(_BRIEFINGS_INDEX_TAIL)
+    return "".join(parts)
+
+
 def rebuild_all_briefs(source_dir: str | Path) -> None:
     """Regenerate every individual post HTML by re-running each markdown source
     through render_post(). Called once after a render_post() template change."""
@@ -1567,14 +1812,15 @@ def rebuild_all_briefs(source_dir: str | Path) -> None:
     count = 0
     POSTS_DIR.mkdir(exist_ok=True)
     for md_path in sorted(source.glob("tucson-brief-*.md")):
-        m = re.search(r"(\d{4}-\d{2}-\d{2})", md_path.stem)
+        m = DATE_RE.search(md_path.stem)
         if not m:
             continue
-        date = datetime.strptime(m.group(1), "%Y-%m-%d")
+        date = _parse_iso(m.group(1))
         slug = post_slug(date)
         md_text = md_path.read_text()
         body_html = md_to_html(md_text)
-        (POSTS_DIR / f"{slug}.html").write_text(render_post(date, body_html, extract_headline(md_text)))
+        (POSTS_DIR / f"{slug}.html").write_bytes(
+            render_post(date, body_html, extract_headline(md_text)).encode("utf-8"))
         count += 1
     print(f"  Regenerated {count} daily-brief HTML page(s)")
 
@@ -1805,7 +2051,7 @@ def build_sitemap() -> None:
         if not directory.exists():
             continue
         for f in sorted(directory.glob("*.html")):
-            m = re.search(r"(\d{4}-\d{2}-\d{2})", f.stem)
+            m = DATE_RE.search(f.stem)
             add(f"{prefix}/{f.name}", m.group(1) if m else None)
 
     (SITE_DIR / "sitemap.xml").write_text(
@@ -1847,74 +2093,99 @@ def build_rss(posts: list[dict], limit: int = 30) -> None:
 """)
 
 
-def rebuild_homepage() -> None:
+def rebuild_homepage(posts: list[dict] | None = None) -> None:
     """Rebuild index.html (zoned homepage), briefings.html (full archive), and
     the two hub pages (local-government.html, around-town.html). Callable from
-    any pipeline that publishes new content."""
-    posts = collect_existing_posts()
+    any pipeline that publishes new content. Without `posts` it rescans posts/
+    (cheap — the lede cache makes that one stat per unchanged file) and
+    refreshes INDEX_STATE to match; generate_many() passes its spliced list."""
+    if posts is None:
+        posts = collect_existing_posts()
+        _save_index_state(posts)
     latest_meeting = collect_latest_meeting()
     latest_report = collect_latest_report()
     latest_filing = collect_latest_filing()
     latest_indepth = collect_latest_indepth()
 
-    (SITE_DIR / "index.html").write_text(
-        render_homepage(posts, latest_meeting, latest_report, latest_filing, latest_indepth)
+    # Pages are written as UTF-8 bytes directly — skips the text-mode
+    # TextIOWrapper (and its locale-dependent default encoding).
+    (SITE_DIR / "index.html").write_bytes(
+        render_homepage(posts, latest_meeting, latest_report, latest_filing, latest_indepth).encode("utf-8")
     )
-    (SITE_DIR / "briefings.html").write_text(render_briefings_index(posts))
-    (SITE_DIR / "local-government.html").write_text(
-        render_local_government(latest_meeting, latest_report)
+    (SITE_DIR / "briefings.html").write_bytes(render_briefings_index(posts).encode("utf-8"))
+    (SITE_DIR / "local-government.html").write_bytes(
+        render_local_government(latest_meeting, latest_report).encode("utf-8")
     )
-    (SITE_DIR / "around-town.html").write_text(
-        render_around_town(collect_around_town_items())
+    (SITE_DIR / "around-town.html").write_bytes(
+        render_around_town(collect_around_town_items()).encode("utf-8")
     )
-    (SITE_DIR / "newsletter.html").write_text(render_newsletter())
+    (SITE_DIR / "newsletter.html").write_bytes(render_newsletter().encode("utf-8"))
     restamp_edition_nav(posts)
     build_sitemap()
     build_rss(posts)
     print(f"  Rebuilt: index.html + briefings.html + local-government.html + around-town.html + newsletter.html + sitemap.xml + rss.xml ({len(posts)} briefing(s))")
 
 
+def generate_many(md_paths: list[str]) -> None:
+    """Publish one or more briefings, then rebuild the homepage once. A batch
+    run (`generate_post.py a.md b.md …`) pays interpreter start-up, template
+    setup, the listing load, and the homepage/archive/sitemap/RSS rebuild once,
+    instead of once per file as a shell loop over single invocations would."""
+    # Validate the whole batch (file exists, date parses) before writing
+    # anything, so a bad path can't leave published posts out of INDEX_STATE.
+    dated = []
+    for md_path in md_paths:
+        if not os.path.isfile(md_path):
+            print(f"Error: file not found: {md_path}", file=sys.stderr)
+            sys.exit(1)
+        dated.append((md_path, parse_date_from_filename(md_path)))
+
+    POSTS_DIR.mkdir(exist_ok=True)
+    posts = load_posts()
+    try:
+        for md_path, date in dated:
+            slug = post_slug(date)
+            md_text = Path(md_path).read_text()
+            body_html = md_to_html(md_text)
+
+            post_file = POSTS_DIR / f"{slug}.html"
+            post_html = render_post(date, body_html, extract_headline(md_text))
+            post_file.write_bytes(post_html.encode("utf-8"))
+            print(f"Wrote {post_file}")
+
+            # Splice into the listing instead of rescanning posts/. The lede comes
+            # from the rendered page, exactly as a rescan would derive it.
+            _splice_post(posts, {"date": date, "slug": slug, "lede": _post_lede(post_html)})
+    finally:
+        # Even if a later file fails, every post written so far stays listed.
+        _save_index_state(posts)
+    rebuild_homepage(posts)
+
+
 # ---------------------------------------------------------------------------
 # CLI
 # ---------------------------------------------------------------------------
 
 def main():
     parser = argparse.ArgumentParser(description="Generate a TDB daily-brief post and rebuild the homepage.")
-    parser.add_argument("briefing", nargs="?", help="Path to tucson-brief-YYYY-MM-DD.md")
+    parser.add_argument("briefing", nargs="*",
+                        help="Path(s) to tucson-brief-YYYY-MM-DD.md; several are published as one batch.")
     parser.add_argument("--rebuild-homepage", action="store_true",
                         help="Refresh index.html and briefings.html only; do not process a briefing.")
     parser.add_argument("--rebuild-all", metavar="DIR",
                         help="Regenerate all individual post HTML from .md files in DIR, then rebuild homepage.")
     args = parser.parse_args()
 
-    if args.rebuild_all:
-        rebuild_all_briefs(args.rebuild_all)
-        rebuild_homepage()
-        return
-
-    if args.rebuild_homepage:
+    if args.rebuild_all or args.rebuild_homepage:
+        if args.rebuild_all:
+            rebuild_all_briefs(args.rebuild_all)
         rebuild_homepage()
         return
 
     if not args.briefing:
         parser.error("provide a briefing path, or use --rebuild-homepage")
 
-    md_path = args.briefing
-    if not os.path.isfile(md_path):
-        print(f"Error: file not found: {md_path}", file=sys.stderr)
-        sys.exit(1)
-
-    date = parse_date_from_filename(md_path)
-    slug = post_slug(date)
-    md_text = Path(md_path).read_text()
-    body_html = md_to_html(md_text)
-
-    POSTS_DIR.mkdir(exist_ok=True)
-    post_file = POSTS_DIR / f"{slug}.html"
-    post_file.write_text(render_post(date, body_html, extract_headline(md_text)))
-    print(f"Wrote {post_file}")
-
-    rebuild_homepage()
+    generate_many(args.briefing)
 
 
 if __name__ == "__main__":